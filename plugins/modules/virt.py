@@ -154,6 +154,7 @@ status:
     returned: success
 '''
 
+import platform
 import traceback
 
 try:
@@ -208,6 +209,18 @@ MUTATE_FLAGS = ['ADD_UUID', 'ADD_MAC_ADDRESSES', 'ADD_MAC_ADDRESSES_FUZZY']
 ALL_FLAGS = []
 ALL_FLAGS.extend(ENTRY_UNDEFINE_FLAGS_MAP.keys())
 
+ARGUMENT_SPEC = dict(
+    name=dict(type='str', aliases=['guest']),
+    state=dict(type='str', choices=['destroyed', 'paused', 'running', 'shutdown']),
+    autostart=dict(type='bool'),
+    command=dict(type='str', choices=ALL_COMMANDS),
+    flags=dict(type='list', elements='str', choices=ALL_FLAGS),
+    force=dict(type='bool'),
+    uri=dict(type='str', default='qemu:///system'),
+    xml=dict(type='str'),
+    mutate_flags=dict(type='list', elements='str', choices=MUTATE_FLAGS, default=['ADD_UUID']),
+)
+
 
 class VMNotFound(Exception):
     pass
@@ -219,10 +232,7 @@ class LibvirtConnection(object):
 
         self.module = module
 
-        cmd = "uname -r"
-        rc, stdout, stderr = self.module.run_command(cmd)
-
-        if "xen" in stdout:
+        if "xen" in platform.release():
             conn = libvirt.open(None)
         elif "esx" in uri:
             auth = [[libvirt.VIR_CRED_AUTHNAME, libvirt.VIR_CRED_NOECHOPROMPT], [], None]
@@ -325,9 +335,13 @@ class Virt(object):
     def __init__(self, uri, module):
         self.module = module
         self.uri = uri
+        self.conn = None
 
     def __get_conn(self):
-        self.conn = LibvirtConnection(self.uri, self.module)
+        # Most methods call this before talking to libvirt, so open the
+        # connection once and reuse it instead of reconnecting every time.
+        if self.conn is None:
+            self.conn = LibvirtConnection(self.uri, self.module)
         return self.conn
 
     def get_vm(self, vmid):
@@ -835,17 +849,7 @@ def core(module):
 
 def main():
     module = AnsibleModule(
-        argument_spec=dict(
-            name=dict(type='str', aliases=['guest']),
-            state=dict(type='str', choices=['destroyed', 'paused', 'running', 'shutdown']),
-            autostart=dict(type='bool'),
-            command=dict(type='str', choices=ALL_COMMANDS),
-            flags=dict(type='list', elements='str', choices=ALL_FLAGS),
-            force=dict(type='bool'),
-            uri=dict(type='str', default='qemu:///system'),
-            xml=dict(type='str'),
-            mutate_flags=dict(type='list', elements='str', choices=MUTATE_FLAGS, default=['ADD_UUID']),
-        ),
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True
     )
 
@@ -124,6 +124,8 @@ EXAMPLES = '''
     xml: "<host mac='FC:C2:33:00:6c:3c' name='my_vm' ip='192.168.122.30'/>"
 '''
 
+import traceback
+
 try:
     import libvirt
 except ImportError:
@@ -169,6 +171,15 @@ ENTRY_STATE_PERSISTENT_MAP = {
     1: "yes"
 }
 
+ARGUMENT_SPEC = dict(
+    name=dict(aliases=['network']),
+    state=dict(choices=['active', 'inactive', 'present', 'absent']),
+    command=dict(choices=ALL_COMMANDS),
+    uri=dict(default='qemu:///system'),
+    xml=dict(),
+    autostart=dict(type='bool')
+)
+
 
 class EntryNotFound(Exception):
     pass
@@ -599,14 +610,7 @@ def core(module):
 def main():
 
     module = AnsibleModule(
-        argument_spec=dict(
-            name=dict(aliases=['network']),
-            state=dict(choices=['active', 'inactive', 'present', 'absent']),
-            command=dict(choices=ALL_COMMANDS),
-            uri=dict(default='qemu:///system'),
-            xml=dict(),
-            autostart=dict(type='bool')
-        ),
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True,
         required_if=[
             ('command', 'create', ['name']),
@@ -635,7 +639,7 @@ def main():
     try:
         rc, result = core(module)
     except Exception as e:
-        module.fail_json(msg=str(e))
+        module.fail_json(msg=to_native(e), exception=traceback.format_exc())
 
     if rc != 0:  # something went wrong emit the msg
         module.fail_json(rc=rc, msg=result)
@@ -133,6 +133,8 @@ EXAMPLES = '''
     name: vms
 '''
 
+import traceback
+
 try:
     import libvirt
 except ImportError:
@@ -148,6 +150,7 @@ else:
     HAS_XML = True
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
 
 
 VIRT_FAILED = 1
@@ -201,6 +204,23 @@ ALL_MODES = []
 ALL_MODES.extend(ENTRY_BUILD_FLAGS_MAP.keys())
 ALL_MODES.extend(ENTRY_DELETE_FLAGS_MAP.keys())
 
+# facts() keys filled from an attribute of an optional <source> child element
+POOL_SOURCE_ATTRIBUTES = (
+    ("host", "/pool/source/host", "name"),
+    ("source_path", "/pool/source/dir", "path"),
+    ("format", "/pool/source/format", "type"),
+)
+
+ARGUMENT_SPEC = dict(
+    name=dict(aliases=['pool']),
+    state=dict(choices=['active', 'inactive', 'present', 'absent', 'undefined', 'deleted']),
+    command=dict(choices=ALL_COMMANDS),
+    uri=dict(default='qemu:///system'),
+    xml=dict(),
+    autostart=dict(type='bool'),
+    mode=dict(choices=ALL_MODES),
+)
+
 
 class EntryNotFound(Exception):
     pass
@@ -221,18 +241,15 @@ class LibvirtConnection(object):
 
     def find_entry(self, entryid):
         # entryid = -1 returns a list of everything
-
-        # Get all entries
-        results = self.conn.listAllStoragePools()
-
         if entryid == -1:
-            return results
+            return self.conn.listAllStoragePools()
 
-        for entry in results:
-            if entry.name() == entryid:
-                return entry
-
-        raise EntryNotFound("storage pool %s not found" % entryid)
+        try:
+            return self.conn.storagePoolLookupByName(entryid)
+        except libvirt.libvirtError as e:
+            if e.get_error_code() == libvirt.VIR_ERR_NO_STORAGE_POOL:
+                raise EntryNotFound("storage pool %s not found" % entryid)
+            raise
 
     def create(self, entryid):
         if not self.module.check_mode:
@@ -274,67 +291,38 @@ class LibvirtConnection(object):
             except Exception:
                 return ENTRY_STATE_ACTIVE_MAP.get("inactive", "unknown")
 
-    def get_uuid(self, entryid):
-        return self.find_entry(entryid).UUIDString()
+    def get_uuid(self, pool):
+        return pool.UUIDString()
 
     def get_xml(self, entryid):
         return self.find_entry(entryid).XMLDesc(0)
 
-    def get_info(self, entryid):
-        return self.find_entry(entryid).info()
+    def get_info(self, pool):
+        return pool.info()
 
-    def get_volume_count(self, entryid):
-        return self.find_entry(entryid).numOfVolumes()
+    def get_volume_names(self, pool):
+        return pool.listAllVolumes()
 
-    def get_volume_names(self, entryid):
-        return self.find_entry(entryid).listAllVolumes()
+    def get_xml_details(self, pool):
+        # Parse the pool XML once and collect every field facts() reports
+        # from it; optional elements missing from the XML are left out.
+        xml = etree.fromstring(pool.XMLDesc(0))
+        details = {"type": xml.get('type')}
 
-    def get_devices(self, entryid):
-        xml = etree.fromstring(self.find_entry(entryid).XMLDesc(0))
-        if xml.xpath('/pool/source/device'):
-            result = []
-            for device in xml.xpath('/pool/source/device'):
-                result.append(device.get('path'))
-        try:
-            return result
-        except Exception:
-            raise ValueError('No devices specified')
+        path = xml.xpath('/pool/target/path')
+        if path:
+            details["path"] = path[0].text
 
-    def get_format(self, entryid):
-        xml = etree.fromstring(self.find_entry(entryid).XMLDesc(0))
-        try:
-            result = xml.xpath('/pool/source/format')[0].get('type')
-        except Exception:
-            raise ValueError('Format not specified')
-        return result
+        for key, xpath, attribute in POOL_SOURCE_ATTRIBUTES:
+            element = xml.xpath(xpath)
+            if element:
+                details[key] = element[0].get(attribute)
 
-    def get_host(self, entryid):
-        xml = etree.fromstring(self.find_entry(entryid).XMLDesc(0))
-        try:
-            result = xml.xpath('/pool/source/host')[0].get('name')
-        except Exception:
-            raise ValueError('Host not specified')
-        return result
+        devices = xml.xpath('/pool/source/device')
+        if devices:
+            details["devices"] = [device.get('path') for device in devices]
 
-    def get_source_path(self, entryid):
-        xml = etree.fromstring(self.find_entry(entryid).XMLDesc(0))
-        try:
-            result = xml.xpath('/pool/source/dir')[0].get('path')
-        except Exception:
-            raise ValueError('Source path not specified')
-        return result
-
-    def get_path(self, entryid):
-        xml = etree.fromstring(self.find_entry(entryid).XMLDesc(0))
-        try:
-            result = xml.xpath('/pool/target/path')[0].text
-        except Exception:
-            raise ValueError('Target path not specified')
-        return result
-
-    def get_type(self, entryid):
-        xml = etree.fromstring(self.find_entry(entryid).XMLDesc(0))
-        return xml.get('type')
+        return details
 
     def build(self, entryid, flags):
         if not self.module.check_mode:
@@ -358,8 +346,8 @@ class LibvirtConnection(object):
             if state:
                 return self.module.exit_json(changed=True)
 
-    def get_autostart(self, entryid):
-        state = self.find_entry(entryid).autostart()
+    def get_autostart(self, pool):
+        state = pool.autostart()
         return ENTRY_STATE_AUTOSTART_MAP.get(state, "unknown")
 
     def get_autostart2(self, entryid):
@@ -385,8 +373,8 @@ class LibvirtConnection(object):
     def refresh(self, entryid):
         return self.find_entry(entryid).refresh()
 
-    def get_persistent(self, entryid):
-        state = self.find_entry(entryid).isPersistent()
+    def get_persistent(self, pool):
+        state = pool.isPersistent()
         return ENTRY_STATE_PERSISTENT_MAP.get(state, "unknown")
 
     def define_from_xml(self, entryid, xml):
@@ -409,6 +397,13 @@ class VirtStoragePool(object):
     def get_pool(self, entryid):
         return self.conn.find_entry(entryid)
 
+    def has_pool(self, entryid):
+        try:
+            self.conn.find_entry(entryid)
+        except EntryNotFound:
+            return False
+        return True
+
     def list_pools(self, state=None):
         results = []
         for entry in self.conn.find_entry(-1):
@@ -421,9 +416,9 @@ class VirtStoragePool(object):
 
     def state(self):
         results = []
-        for entry in self.list_pools():
-            state_blurb = self.conn.get_status(entry)
-            results.append("%s %s" % (entry, state_blurb))
+        for entry in self.conn.find_entry(-1):
+            state_blurb = self.conn.get_status2(entry)
+            results.append("%s %s" % (entry.name(), state_blurb))
         return results
 
     def autostart(self, entryid):
@@ -473,62 +468,32 @@ class VirtStoragePool(object):
 
     def facts(self, facts_mode='facts'):
         results = dict()
-        for entry in self.list_pools():
-            results[entry] = dict()
-            if self.conn.find_entry(entry):
-                data = self.conn.get_info(entry)
-                # libvirt returns maxMem, memory, and cpuTime as long()'s, which
-                # xmlrpclib tries to convert to regular int's during serialization.
-                # This throws exceptions, so convert them to strings here and
-                # assume the other end of the xmlrpc connection can figure things
-                # out or doesn't care.
-                results[entry] = {
-                    "status": ENTRY_STATE_INFO_MAP.get(data[0], "unknown"),
-                    "size_total": str(data[1]),
-                    "size_used": str(data[2]),
-                    "size_available": str(data[3]),
-                }
-                results[entry]["autostart"] = self.conn.get_autostart(entry)
-                results[entry]["persistent"] = self.conn.get_persistent(entry)
-                results[entry]["state"] = self.conn.get_status(entry)
-                results[entry]["type"] = self.conn.get_type(entry)
-                results[entry]["uuid"] = self.conn.get_uuid(entry)
-                if self.conn.find_entry(entry).isActive():
-                    results[entry]["volume_count"] = self.conn.get_volume_count(entry)
-                    results[entry]["volumes"] = list()
-                    for volume in self.conn.get_volume_names(entry):
-                        results[entry]["volumes"].append(volume.name())
-                else:
-                    results[entry]["volume_count"] = -1
-
-                try:
-                    results[entry]["path"] = self.conn.get_path(entry)
-                except ValueError:
-                    pass
-
-                try:
-                    results[entry]["host"] = self.conn.get_host(entry)
-                except ValueError:
-                    pass
-
-                try:
-                    results[entry]["source_path"] = self.conn.get_source_path(entry)
-                except ValueError:
-                    pass
-
-                try:
-                    results[entry]["format"] = self.conn.get_format(entry)
-                except ValueError:
-                    pass
-
-                try:
-                    devices = self.conn.get_devices(entry)
-                    results[entry]["devices"] = devices
-                except ValueError:
-                    pass
-
+        # Work on the pool handles returned by a single listAllStoragePools()
+        # call rather than looking every pool up again by name per attribute.
+        for pool in self.conn.find_entry(-1):
+            entry = pool.name()
+            data = self.conn.get_info(pool)
+            # Sizes are reported in bytes as strings. Module results are JSON,
+            # which carries 64-bit integers fine, but the string form is part
+            # of the returned facts that playbooks already consume.
+            results[entry] = {
+                "status": ENTRY_STATE_INFO_MAP.get(data[0], "unknown"),
+                "size_total": str(data[1]),
+                "size_used": str(data[2]),
+                "size_available": str(data[3]),
+            }
+            results[entry]["autostart"] = self.conn.get_autostart(pool)
+            results[entry]["persistent"] = self.conn.get_persistent(pool)
+            results[entry]["state"] = self.conn.get_status2(pool)
+            results[entry]["uuid"] = self.conn.get_uuid(pool)
+            if pool.isActive():
+                volumes = [volume.name() for volume in self.conn.get_volume_names(pool)]
+                results[entry]["volume_count"] = len(volumes)
+                results[entry]["volumes"] = volumes
             else:
-                results[entry]["state"] = self.conn.get_status(entry)
+                results[entry]["volume_count"] = -1
+
+            results[entry].update(self.conn.get_xml_details(pool))
 
         facts = dict()
         if facts_mode == 'facts':
@@ -539,15 +504,42 @@ class VirtStoragePool(object):
         return facts
 
 
+# Pool commands that only need the pool name; define, build and delete take
+# extra arguments and are handled directly in core().
+ENTRY_COMMAND_HANDLERS = dict(
+    create=VirtStoragePool.create,
+    status=VirtStoragePool.status,
+    start=VirtStoragePool.start,
+    stop=VirtStoragePool.stop,
+    undefine=VirtStoragePool.undefine,
+    destroy=VirtStoragePool.destroy,
+    get_xml=VirtStoragePool.get_xml,
+    refresh=VirtStoragePool.refresh,
+)
+
+HOST_COMMAND_HANDLERS = dict(
+    list_pools=VirtStoragePool.list_pools,
+    facts=VirtStoragePool.facts,
+    info=VirtStoragePool.info,
+)
+
+
 def core(module):
 
-    state = module.params.get('state', None)
-    name = module.params.get('name', None)
-    command = module.params.get('command', None)
-    uri = module.params.get('uri', None)
-    xml = module.params.get('xml', None)
-    autostart = module.params.get('autostart', None)
-    mode = module.params.get('mode', None)
+    p = module.params
+    state = p['state']
+    name = p['name']
+    command = p['command']
+    uri = p['uri']
+    xml = p['xml']
+    autostart = p['autostart']
+    mode = p['mode']
+
+    # Listing pools by state is the only state request that needs no name;
+    # check the rest before a libvirt connection is opened.
+    if not name:
+        if (state and command != 'list_pools') or (not state and not command and autostart is not None):
+            module.fail_json(msg="state change requires a specified name")
 
     v = VirtStoragePool(uri, module)
     res = {}
@@ -559,15 +551,12 @@ def core(module):
         return VIRT_SUCCESS, res
 
     if state:
-        if not name:
-            module.fail_json(msg="state change requires a specified name")
-
         res['changed'] = False
-        if state in ['active']:
+        if state == 'active':
             if v.status(name) != 'active':
                 res['changed'] = True
                 res['msg'] = v.start(name)
-        elif state in ['present']:
+        elif state == 'present':
             try:
                 v.get_pool(name)
             except EntryNotFound:
@@ -575,22 +564,19 @@ def core(module):
                     module.fail_json(msg="storage pool '" + name + "' not present, but xml not specified")
                 v.define(name, xml)
                 res = {'changed': True, 'created': name}
-        elif state in ['inactive']:
-            entries = v.list_pools()
-            if name in entries:
+        elif state == 'inactive':
+            if v.has_pool(name):
                 if v.status(name) != 'inactive':
                     res['changed'] = True
                     res['msg'] = v.destroy(name)
-        elif state in ['undefined', 'absent']:
-            entries = v.list_pools()
-            if name in entries:
+        elif state in ('undefined', 'absent'):
+            if v.has_pool(name):
                 if v.status(name) != 'inactive':
                     v.destroy(name)
                 res['changed'] = True
                 res['msg'] = v.undefine(name)
-        elif state in ['deleted']:
-            entries = v.list_pools()
-            if name in entries:
+        elif state == 'deleted':
+            if v.has_pool(name):
                 if v.status(name) != 'inactive':
                     v.destroy(name)
                 v.delete(name, mode)
@@ -603,8 +589,6 @@ def core(module):
 
     if command:
         if command in ENTRY_COMMANDS:
-            if not name:
-                module.fail_json(msg="%s requires 1 argument: name" % command)
             if command == 'define':
                 if not xml:
                     module.fail_json(msg="define requires xml argument")
@@ -624,13 +608,13 @@ def core(module):
                 if not isinstance(res, dict):
                     res = {'changed': True, command: res}
                 return VIRT_SUCCESS, res
-            res = getattr(v, command)(name)
+            res = ENTRY_COMMAND_HANDLERS[command](v, name)
             if not isinstance(res, dict):
                 res = {command: res}
             return VIRT_SUCCESS, res
 
-        elif hasattr(v, command):
-            res = getattr(v, command)()
+        elif command in HOST_COMMAND_HANDLERS:
+            res = HOST_COMMAND_HANDLERS[command](v)
             if not isinstance(res, dict):
                 res = {command: res}
             return VIRT_SUCCESS, res
@@ -639,9 +623,6 @@ def core(module):
             module.fail_json(msg="Command %s not recognized" % command)
 
     if autostart is not None:
-        if not name:
-            module.fail_json(msg="state change requires a specified name")
-
         res['changed'] = False
         if autostart:
             if not v.get_autostart(name):
@@ -660,16 +641,21 @@ def core(module):
 def main():
 
     module = AnsibleModule(
-        argument_spec=dict(
-            name=dict(aliases=['pool']),
-            state=dict(choices=['active', 'inactive', 'present', 'absent', 'undefined', 'deleted']),
-            command=dict(choices=ALL_COMMANDS),
-            uri=dict(default='qemu:///system'),
-            xml=dict(),
-            autostart=dict(type='bool'),
-            mode=dict(choices=ALL_MODES),
-        ),
-        supports_check_mode=True
+        argument_spec=ARGUMENT_SPEC,
+        supports_check_mode=True,
+        required_if=[
+            ('command', 'create', ['name']),
+            ('command', 'status', ['name']),
+            ('command', 'start', ['name']),
+            ('command', 'stop', ['name']),
+            ('command', 'build', ['name']),
+            ('command', 'delete', ['name']),
+            ('command', 'undefine', ['name']),
+            ('command', 'destroy', ['name']),
+            ('command', 'get_xml', ['name']),
+            ('command', 'define', ['name']),
+            ('command', 'refresh', ['name']),
+        ]
     )
 
     if not HAS_VIRT:
@@ -686,7 +672,7 @@ def main():
     try:
         rc, result = core(module)
     except Exception as e:
-        module.fail_json(msg=str(e))
+        module.fail_json(msg=to_native(e), exception=traceback.format_exc())
 
     if rc != 0:  # something went wrong emit the msg
         module.fail_json(rc=rc, msg=result)
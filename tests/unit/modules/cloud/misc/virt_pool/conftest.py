@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+import pytest
+
+from ansible_collections.community.libvirt.plugins.modules import virt_pool
+
+from ansible_collections.community.libvirt.tests.unit.compat import mock
+
+
+virt_pool.libvirt = None
+virt_pool.HAS_VIRT = True
+
+
+DIR_POOL_XML = """<pool type='dir'>
+  <name>%s</name>
+  <source>
+  </source>
+  <target>
+    <path>/var/lib/libvirt/images</path>
+  </target>
+</pool>"""
+
+NETFS_POOL_XML = """<pool type='netfs'>
+  <name>%s</name>
+  <source>
+    <host name='nfs.example.com'/>
+    <dir path='/exports/images'/>
+    <format type='nfs'/>
+  </source>
+  <target>
+    <path>/mnt/images</path>
+  </target>
+</pool>"""
+
+LOGICAL_POOL_XML = """<pool type='logical'>
+  <name>%s</name>
+  <source>
+    <device path='/dev/sdb1'/>
+    <device path='/dev/sdc1'/>
+  </source>
+  <target>
+    <path>/dev/vg_images</path>
+  </target>
+</pool>"""
+
+
+class DummyVolume():
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+class DummyPool():
+    def __init__(self, name, isActive=True, volumes=None, xml=DIR_POOL_XML):
+        self._name = name
+        self._isActive = isActive
+        self._volumes = [DummyVolume(v) for v in (volumes or [])]
+        self._xml = xml
+        self.xml_calls = 0
+
+    def name(self):
+        return self._name
+
+    def isActive(self):
+        return self._isActive
+
+    def info(self):
+        return [2 if self._isActive else 0, 107374182400, 53687091200, 53687091200]
+
+    def autostart(self):
+        return 1
+
+    def isPersistent(self):
+        return 1
+
+    def UUIDString(self):
+        return '00000000-0000-0000-0000-%012d' % len(self._name)
+
+    def listAllVolumes(self):
+        return list(self._volumes)
+
+    def XMLDesc(self, flags):
+        self.xml_calls += 1
+        return self._xml % self._name
+
+
+class DummyLibvirtConn():
+    def __init__(self):
+        self._pools = [
+            DummyPool("inactive_pool", isActive=False),
+            DummyPool("active_pool", isActive=True, volumes=["disk0.qcow2", "disk1.qcow2"]),
+            DummyPool("nfs_pool", isActive=False, xml=NETFS_POOL_XML),
+            DummyPool("lvm_pool", isActive=False, xml=LOGICAL_POOL_XML)]
+        self.list_calls = 0
+
+    def listAllStoragePools(self):
+        self.list_calls += 1
+        return list(self._pools)
+
+    def storagePoolLookupByName(self, name):
+        for i in self._pools:
+            if i.name() == name:
+                return i
+        raise DummyLibvirt.libvirtError(DummyLibvirt.VIR_ERR_NO_STORAGE_POOL)
+
+
+class DummyLibvirt():
+    VIR_ERR_NO_STORAGE_POOL = 'VIR_ERR_NO_STORAGE_POOL'
+
+    @classmethod
+    def open(cls, uri):
+        return DummyLibvirtConn()
+
+    class libvirtError(Exception):
+        def __init__(self, error_code):
+            self.error_code = error_code
+
+        def get_error_code(self):
+            return self.error_code
+
+
+@pytest.fixture
+def dummy_libvirt(monkeypatch):
+    monkeypatch.setattr(virt_pool, 'libvirt', DummyLibvirt)
+    return DummyLibvirt
+
+
+@pytest.fixture
+def virt_pool_obj(dummy_libvirt):
+    return virt_pool.VirtStoragePool('qemu:///nowhere', mock.MagicMock())
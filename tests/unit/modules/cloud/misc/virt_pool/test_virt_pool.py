@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+import pytest
+
+from ansible_collections.community.libvirt.plugins.modules import virt_pool
+
+from ansible_collections.community.libvirt.tests.unit.compat import mock
+
+
+def test_virt_pool_facts(virt_pool_obj):
+    pools = virt_pool_obj.facts()["ansible_facts"]["ansible_libvirt_pools"]
+
+    assert sorted(pools) == ["active_pool", "inactive_pool", "lvm_pool", "nfs_pool"]
+    assert pools["active_pool"]["state"] == "active"
+    assert pools["active_pool"]["status"] == "running"
+    assert pools["active_pool"]["size_total"] == "107374182400"
+    assert pools["active_pool"]["autostart"] == "yes"
+    assert pools["active_pool"]["type"] == "dir"
+    assert pools["active_pool"]["path"] == "/var/lib/libvirt/images"
+    assert pools["active_pool"]["volume_count"] == 2
+    assert pools["active_pool"]["volumes"] == ["disk0.qcow2", "disk1.qcow2"]
+    assert pools["inactive_pool"]["state"] == "inactive"
+    assert pools["inactive_pool"]["volume_count"] == -1
+    assert "volumes" not in pools["inactive_pool"]
+    assert "host" not in pools["inactive_pool"]
+    assert "devices" not in pools["inactive_pool"]
+
+
+def test_virt_pool_facts_source_details(virt_pool_obj):
+    pools = virt_pool_obj.facts()["ansible_facts"]["ansible_libvirt_pools"]
+
+    assert pools["nfs_pool"]["type"] == "netfs"
+    assert pools["nfs_pool"]["host"] == "nfs.example.com"
+    assert pools["nfs_pool"]["source_path"] == "/exports/images"
+    assert pools["nfs_pool"]["format"] == "nfs"
+    assert pools["nfs_pool"]["path"] == "/mnt/images"
+    assert pools["lvm_pool"]["devices"] == ["/dev/sdb1", "/dev/sdc1"]
+    assert "format" not in pools["lvm_pool"]
+
+
+def test_virt_pool_facts_parses_xml_once_per_pool(virt_pool_obj):
+    virt_pool_obj.facts()
+    for pool in virt_pool_obj.conn.conn._pools:
+        assert pool.xml_calls == 1
+
+
+def test_virt_pool_facts_lists_pools_once(virt_pool_obj):
+    virt_pool_obj.facts()
+    assert virt_pool_obj.conn.conn.list_calls == 1
+
+
+def test_virt_pool_info(virt_pool_obj):
+    pools = virt_pool_obj.info()["pools"]
+    assert sorted(pools) == ["active_pool", "inactive_pool", "lvm_pool", "nfs_pool"]
+
+
+def test_virt_pool_state(virt_pool_obj):
+    assert virt_pool_obj.state() == [
+        "inactive_pool inactive", "active_pool active", "nfs_pool inactive", "lvm_pool inactive"]
+    assert virt_pool_obj.conn.conn.list_calls == 1
+
+
+def test_virt_pool_has_pool(virt_pool_obj):
+    assert virt_pool_obj.has_pool("active_pool")
+    assert not virt_pool_obj.has_pool("missing_pool")
+    assert virt_pool_obj.conn.conn.list_calls == 0
+
+
+def test_virt_pool_command_handlers_cover_commands():
+    special = set(['define', 'build', 'delete'])
+    assert set(virt_pool.ENTRY_COMMAND_HANDLERS) == set(virt_pool.ENTRY_COMMANDS) - special
+    assert set(virt_pool.HOST_COMMAND_HANDLERS) == set(virt_pool.HOST_COMMANDS)
+
+
+def test_virt_pool_core_status_command(dummy_libvirt):
+    module = mock.MagicMock()
+    module.check_mode = False
+    module.params = dict(state=None, name='active_pool', command='status',
+                         uri='qemu:///nowhere', xml=None, autostart=None, mode=None)
+    assert virt_pool.core(module) == (virt_pool.VIRT_SUCCESS, {'status': 'active'})
+
+
+@pytest.mark.parametrize("params", [
+    dict(state='active', autostart=None),
+    dict(state=None, autostart=True),
+])
+def test_virt_pool_core_requires_name_before_connecting(dummy_libvirt, params):
+    module = mock.MagicMock()
+    module.fail_json.side_effect = SystemExit
+    module.params = dict(name=None, command=None, uri='qemu:///nowhere', xml=None, mode=None, **params)
+    with mock.patch.object(virt_pool, 'VirtStoragePool') as pool_class:
+        with pytest.raises(SystemExit):
+            virt_pool.core(module)
+    module.fail_json.assert_called_once_with(msg="state change requires a specified name")
+    pool_class.assert_not_called()